@@ -2,7 +2,12 @@
 
 __version__ = "0.9.1"
 
-from .bring import Bring
+from importlib import import_module
+import sys
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+# BEGIN GENERATED EXPORTS (prepare_exports.py)
 from .exceptions import (
     BringAuthException,
     BringEMailInvalidException,
@@ -11,25 +16,28 @@ from .exceptions import (
     BringTranslationException,
     BringUserUnknownException,
 )
-from .types import (
-    BringActivityResponse,
-    BringAuthResponse,
-    BringAuthTokenResponse,
-    BringItem,
-    BringItemOperation,
-    BringItemsResponse,
-    BringListItemDetails,
-    BringListItemsDetailsResponse,
-    BringListResponse,
-    BringNotificationsConfigType,
-    BringNotificationType,
-    BringSyncCurrentUserResponse,
-    BringUserListSettingEntry,
-    BringUserSettingsEntry,
-    BringUserSettingsResponse,
-)
 
-__all__ = [
+if TYPE_CHECKING:
+    from .bring import Bring
+    from .types import (
+        BringActivityResponse,
+        BringAuthResponse,
+        BringAuthTokenResponse,
+        BringItem,
+        BringItemOperation,
+        BringItemsResponse,
+        BringListItemDetails,
+        BringListItemsDetailsResponse,
+        BringListResponse,
+        BringNotificationsConfigType,
+        BringNotificationType,
+        BringSyncCurrentUserResponse,
+        BringUserListSettingEntry,
+        BringUserSettingsEntry,
+        BringUserSettingsResponse,
+    )
+
+__all__ = (
     "Bring",
     "BringActivityResponse",
     "BringAuthException",
@@ -52,4 +60,45 @@ __all__ = [
     "BringUserSettingsEntry",
     "BringUserSettingsResponse",
     "BringUserUnknownException",
-]
+)
+
+_LAZY = MappingProxyType(
+    {
+        "Bring": ".bring",
+        "BringActivityResponse": ".types",
+        "BringAuthResponse": ".types",
+        "BringAuthTokenResponse": ".types",
+        "BringItem": ".types",
+        "BringItemOperation": ".types",
+        "BringItemsResponse": ".types",
+        "BringListItemDetails": ".types",
+        "BringListItemsDetailsResponse": ".types",
+        "BringListResponse": ".types",
+        "BringNotificationsConfigType": ".types",
+        "BringNotificationType": ".types",
+        "BringSyncCurrentUserResponse": ".types",
+        "BringUserListSettingEntry": ".types",
+        "BringUserSettingsEntry": ".types",
+        "BringUserSettingsResponse": ".types",
+    }
+)
+# END GENERATED EXPORTS
+
+
+def __getattr__(name: str) -> Any:
+    """Import the client and types from their submodule on first access."""
+    try:
+        mod_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = sys.modules.get(f"{__name__}{mod_name}") or import_module(
+        mod_name, __name__
+    )
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the public names of the package."""
+    return sorted(__all__)
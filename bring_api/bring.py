@@ -1,13 +1,19 @@
 """Bring api implementation."""
 
 import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from http import HTTPStatus
 from itertools import chain
-import json
 from json import JSONDecodeError
 import logging
+import math
 import os
+import random
+import re
 import time
+from types import MappingProxyType
+from typing import Any, TypeVar
 from uuid import UUID
 
 import aiohttp
@@ -22,10 +28,17 @@ from .const import (
     DEFAULT_HEADERS,
     LOCALES_BASE_URL,
     MAP_LANG_TO_LOCALE,
+    REQUEST_RETRY_ATTEMPTS,
+    REQUEST_RETRY_BACKOFF,
+    REQUEST_RETRY_MAX_DELAY,
+    REQUEST_RETRY_METHODS,
+    REQUEST_RETRY_STATUSES,
+    REQUEST_TIMEOUT,
 )
 from .exceptions import (
     BringAuthException,
     BringEMailInvalidException,
+    BringException,
     BringMissingFieldException,
     BringParseException,
     BringRequestException,
@@ -49,17 +62,85 @@ from .types import (
     UserLocale,
 )
 
+__all__ = ["Bring"]
+
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+_ITEM_CHANGE_LOCATION = MappingProxyType(
+    {
+        "accuracy": "0.0",
+        "altitude": "0.0",
+        "latitude": "0.0",
+        "longitude": "0.0",
+    }
+)
+
+
+_article_translations: dict[str, dict[str, str]] = {}
+
+
+def _read_article_translations(locale: str) -> dict[str, str]:
+    """Read the bundled translation table of a locale, cached per process."""
+    if (dictionary := _article_translations.get(locale)) is None:
+        path = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "locales",
+            f"articles.{locale}.json",
+        )
+        with open(path, "rb") as f:
+            dictionary = _article_translations[locale] = orjson.loads(f.read())
+    return dictionary
+
+
+def _retrieve_exception(task: asyncio.Task[Any]) -> None:
+    """Mark the exception of a shared task as retrieved.
+
+    Callers await shared tasks through `asyncio.shield`, so the exception would
+    otherwise be reported as never retrieved if every caller was cancelled.
+    """
+    if not task.cancelled():
+        task.exception()
+
 
 class Bring:
     """Unofficial Bring API interface."""
 
     def __init__(
-        self, session: aiohttp.ClientSession, mail: str, password: str
+        self,
+        session: aiohttp.ClientSession,
+        mail: str,
+        password: str,
+        timeout: aiohttp.ClientTimeout = REQUEST_TIMEOUT,
+        batch_window: float | None = None,
     ) -> None:
-        """Init function for Bring API."""
+        """Init function for Bring API.
+
+        Parameters
+        ----------
+        session : aiohttp.ClientSession
+            The client session used for all requests.
+        mail : str
+            The e-mail of the Bring account.
+        password : str
+            The password of the Bring account.
+        timeout : aiohttp.ClientTimeout, optional
+            Timeout applied to every request, defaults to REQUEST_TIMEOUT
+            (30 seconds in total, 10 seconds to connect).
+        batch_window : float, optional
+            If set, item changes made with save_item, update_item, remove_item
+            and complete_item are queued for this many seconds and sent as one
+            batch request per list, each call returns once its batch is sent.
+            Changes still queued at shutdown are lost unless flush() is awaited
+            first. By default every change is sent right away.
+
+        """
         self._session = session
+        self.timeout = timeout
+        self.batch_window = batch_window
 
         self.mail = mail
         self.password = password
@@ -69,24 +150,324 @@ class Bring:
         self.user_locale = BRING_DEFAULT_LOCALE
 
         self.__translations: dict[str, dict[str, str]] = {}
+        self.__inverse_translations: dict[str, dict[str, str]] = {}
         self.uuid: UUID | None = None
 
         self.url = URL(API_BASE_URL)
+        self._url_auth = self.url / "v2/bringauth"
+        self._url_token = self._url_auth / "token"
+        self._url_users = self.url / "bringusers"
+        self._url_users_v2 = self.url / "v2/bringusers"
+        self._url_user_settings = self.url / "bringusersettings"
+        self._url_lists = self.url / "bringlists"
+        self._url_lists_v2 = self.url / "v2/bringlists"
+        self._url_notifications = self.url / "v2/bringnotifications/lists"
+        self._url_locales = URL(LOCALES_BASE_URL)
 
         self.headers = DEFAULT_HEADERS.copy()
 
-        self.loop = asyncio.get_running_loop()
+        self._pending_changes: dict[
+            UUID, list[tuple[BringItem, asyncio.Future[aiohttp.ClientResponse]]]
+        ] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task[None] | None = None
+        self._token_refresh: tuple[str, asyncio.Task[BringAuthTokenResponse]] | None = (
+            None
+        )
+        self._pending_gets: dict[URL, asyncio.Task[bytes]] = {}
+        self._settings_lock = asyncio.Lock()
+        self._settings_stale = False
         self.refresh_token = ""
-        self.__expires_in: int
+        self.__expires_at: float
+
+    @staticmethod
+    def create_session() -> aiohttp.ClientSession:
+        """Create a client session for the Bring API.
+
+        The session keeps up to 10 connections per host alive for 75 seconds
+        between requests and caches DNS lookups for 5 minutes. Create it once,
+        share it between all Bring instances and close it on shutdown.
+
+        Returns
+        -------
+        aiohttp.ClientSession
+            A new client session.
+
+        """
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=20, limit_per_host=10, ttl_dns_cache=300, keepalive_timeout=75
+            ),
+            timeout=REQUEST_TIMEOUT,
+        )
 
     @property
     def expires_in(self) -> int:
-        """Refresh token expiration."""
-        return max(0, self.__expires_in - int(time.time()))
+        """Refresh token expiration.
+
+        The deadline is issued by the server and kept in wall-clock time, so
+        it stays correct across a system suspend.
+        """
+        return max(0, math.ceil(self.__expires_at - time.time()))
 
     @expires_in.setter
     def expires_in(self, expires_in: int | str) -> None:
-        self.__expires_in = int(time.time()) + int(expires_in)
+        self.__expires_at = time.time() + int(expires_in)
+
+    @asynccontextmanager
+    async def _request(
+        self, method: str, url: URL, *, json: Any = None, **kwargs: Any
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Send a request and retry transient failures.
+
+        Idempotent requests are retried with exponential backoff and jitter if the
+        connection fails, times out or the server responds with 502, 503 or 504.
+        The last failure is passed on to the caller unchanged.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method.
+        url : URL
+            The request url.
+        json : Any, optional
+            Request body, serialized with orjson.
+        **kwargs : Any
+            Passed on to `aiohttp.ClientSession.request`.
+
+        Yields
+        ------
+        aiohttp.ClientResponse
+            The response, released when the context is left.
+
+        """
+        if json is not None:
+            kwargs["data"] = aiohttp.BytesPayload(
+                orjson.dumps(json), content_type="application/json"
+            )
+        retries = REQUEST_RETRY_ATTEMPTS - 1 if method in REQUEST_RETRY_METHODS else 0
+        attempt = 0
+        while True:
+            try:
+                r = await self._session.request(
+                    method, url, timeout=self.timeout, **kwargs
+                )
+            except (aiohttp.ClientConnectionError, TimeoutError):
+                if attempt >= retries:
+                    raise
+                reason = "request failed"
+            else:
+                if r.status not in REQUEST_RETRY_STATUSES or attempt >= retries:
+                    break
+                r.release()
+                reason = f"status {r.status}"
+
+            delay = min(
+                REQUEST_RETRY_MAX_DELAY,
+                REQUEST_RETRY_BACKOFF * 2**attempt * (1 + random.uniform(0, 0.5)),
+            )
+            attempt += 1
+            _LOGGER.debug(
+                "Retrying %s %s in %.2fs (%s, attempt %s of %s)",
+                method,
+                url,
+                delay,
+                reason,
+                attempt + 1,
+                retries + 1,
+            )
+            await asyncio.sleep(delay)
+
+        async with r:
+            yield r
+
+    async def _get(
+        self,
+        url: URL,
+        parse: Callable[[bytes], _T],
+        name: str,
+        *,
+        coalesce: bool = False,
+    ) -> _T:
+        """Get a resource from the API and parse the response.
+
+        With `coalesce`, concurrent calls for the same url share one request.
+        Pending shared requests are dropped on every write and token change,
+        so a read issued afterwards always fetches fresh data.
+
+        Parameters
+        ----------
+        url : URL
+            The request url.
+        parse : Callable[[bytes], _T]
+            Parser for the response body.
+        name : str
+            Name of the resource for log and error messages.
+        coalesce : bool, default False
+            Share the response with concurrent calls for the same url.
+
+        Returns
+        -------
+        _T
+            The parsed response.
+
+        Raises
+        ------
+        BringRequestException
+            If the request fails.
+        BringParseException
+            If the parsing of the request response fails.
+        BringAuthException
+            If the request fails due to invalid or expired authorization token.
+
+        """
+        if coalesce:
+            task = self._pending_gets.get(url)
+            if task is None or task.done():
+                task = asyncio.get_running_loop().create_task(self.__fetch(url, name))
+                self._pending_gets[url] = task
+
+                def forget(done: asyncio.Task[bytes]) -> None:
+                    if self._pending_gets.get(url) is done:
+                        del self._pending_gets[url]
+
+                task.add_done_callback(forget)
+                task.add_done_callback(_retrieve_exception)
+
+            body = await asyncio.shield(task)
+        else:
+            body = await self.__fetch(url, name)
+        try:
+            return parse(body)
+        except MissingField as e:
+            raise BringMissingFieldException(e) from e
+        except (JSONDecodeError, KeyError) as e:
+            _LOGGER.debug("Exception: Cannot get %s:", name, exc_info=True)
+            raise BringParseException(
+                f"Loading {name} failed during parsing of request response."
+            ) from e
+
+    async def __fetch(self, url: URL, name: str) -> bytes:
+        """Fetch the body of a resource for _get.
+
+        Concurrent _get calls for the same url share one request, every caller
+        parses the body on its own.
+        """
+        try:
+            async with self._request("GET", url, headers=self.headers) as r:
+                body = await r.read()
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Response from %s [%s]: %s",
+                        url,
+                        r.status,
+                        body.decode(errors="replace"),
+                    )
+
+                if r.status == HTTPStatus.UNAUTHORIZED:
+                    try:
+                        errmsg = BringErrorResponse.from_json(body)
+                    except (JSONDecodeError, MissingField):
+                        _LOGGER.debug(
+                            "Exception: Cannot parse request response:", exc_info=True
+                        )
+                    else:
+                        _LOGGER.debug(
+                            "Exception: Cannot get %s: %s", name, errmsg.message
+                        )
+                    raise BringAuthException(
+                        f"Loading {name} failed due to authorization failure, "
+                        "the authorization token is invalid or expired."
+                    )
+
+                r.raise_for_status()
+                return body
+        except TimeoutError as e:
+            _LOGGER.debug("Exception: Cannot get %s:", name, exc_info=True)
+            raise BringRequestException(
+                f"Loading {name} failed due to connection timeout."
+            ) from e
+        except aiohttp.ClientError as e:
+            _LOGGER.debug("Exception: Cannot get %s:", name, exc_info=True)
+            raise BringRequestException(
+                f"Loading {name} failed due to request exception."
+            ) from e
+
+    async def _send(
+        self, method: str, url: URL, action: str, **kwargs: Any
+    ) -> aiohttp.ClientResponse:
+        """Send a change to the API.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method.
+        url : URL
+            The request url.
+        action : str
+            Description of the change for log and error messages.
+        **kwargs : Any
+            Further arguments passed to the request, e.g. `data` or `json`.
+
+        Returns
+        -------
+        Response
+            The server response object.
+
+        Raises
+        ------
+        BringRequestException
+            If the request fails.
+        BringAuthException
+            If the request fails due to invalid or expired authorization token.
+
+        """
+        try:
+            async with self._request(method, url, headers=self.headers, **kwargs) as r:
+                body = (
+                    await r.read()
+                    if r.status == HTTPStatus.UNAUTHORIZED
+                    or _LOGGER.isEnabledFor(logging.DEBUG)
+                    else b""
+                )
+                _LOGGER.debug(
+                    "Response from %s [%s]: %s",
+                    url,
+                    r.status,
+                    body.decode(errors="replace"),
+                )
+
+                if r.status == HTTPStatus.UNAUTHORIZED:
+                    try:
+                        errmsg = BringErrorResponse.from_json(body)
+                    except (JSONDecodeError, MissingField):
+                        _LOGGER.debug(
+                            "Exception: Cannot parse request response:", exc_info=True
+                        )
+                    else:
+                        _LOGGER.debug(
+                            "Exception: %s failed: %s", action, errmsg.message
+                        )
+                    raise BringAuthException(
+                        f"{action} failed due to authorization failure, "
+                        "the authorization token is invalid or expired."
+                    )
+
+                r.raise_for_status()
+                return r
+        except TimeoutError as e:
+            _LOGGER.debug("Exception: %s failed:", action, exc_info=True)
+            raise BringRequestException(
+                f"{action} failed due to connection timeout."
+            ) from e
+        except aiohttp.ClientError as e:
+            _LOGGER.debug("Exception: %s failed:", action, exc_info=True)
+            raise BringRequestException(
+                f"{action} failed due to request exception."
+            ) from e
+        finally:
+            # A read started before the write may return outdated data.
+            self._pending_gets.clear()
 
     async def login(self) -> BringAuthResponse:
         """Try to login.
@@ -110,20 +491,21 @@ class Bring:
         user_data = {"email": self.mail, "password": self.password}
 
         try:
-            url = self.url / "v2/bringauth"
-            async with self._session.post(url, data=user_data) as r:
+            url = self._url_auth
+            async with self._request("POST", url, data=user_data) as r:
+                body = await r.read()
                 _LOGGER.debug(
                     "Response from %s [%s]: %s",
                     url,
                     r.status,
-                    await r.text()
+                    body.decode(errors="replace")
                     if r.status != 200
                     else "",  # do not log response on success, as it contains sensible data
                 )
 
                 if r.status == HTTPStatus.UNAUTHORIZED:
                     try:
-                        errmsg = BringErrorResponse.from_json(await r.text())
+                        errmsg = BringErrorResponse.from_json(body)
                     except (JSONDecodeError, aiohttp.ClientError):
                         _LOGGER.debug(
                             "Exception: Cannot parse login request response:",
@@ -136,14 +518,16 @@ class Bring:
                         "please check your email and password."
                     )
                 if r.status == HTTPStatus.BAD_REQUEST:
-                    _LOGGER.debug("Exception: Cannot login: %s", await r.text())
+                    _LOGGER.debug(
+                        "Exception: Cannot login: %s", body.decode(errors="replace")
+                    )
                     raise BringAuthException(
                         "Login failed due to bad request, please check your email."
                     )
                 r.raise_for_status()
 
                 try:
-                    data = BringAuthResponse.from_json(await r.text())
+                    data = BringAuthResponse.from_json(body)
                 except MissingField as e:
                     raise BringMissingFieldException(e) from e
                 except JSONDecodeError as e:
@@ -169,12 +553,15 @@ class Bring:
         self.headers["Authorization"] = f"{data.token_type} {data.access_token}"
         self.refresh_token = data.refresh_token
         self.expires_in = data.expires_in
+        self._pending_gets.clear()
 
-        locale = (await self.get_user_account()).userLocale
+        user_account, _ = await asyncio.gather(
+            self.get_user_account(), self.reload_user_list_settings()
+        )
+        locale = user_account.userLocale
         self.headers["X-BRING-COUNTRY"] = locale.country
         self.user_locale = self.map_user_language_to_locale(locale)
 
-        await self.reload_user_list_settings()
         await self.reload_article_translations()
 
         return data
@@ -188,7 +575,8 @@ class Bring:
             If the request fails.
 
         """
-        self.user_list_settings = await self.__load_user_list_settings()
+        async with self._settings_lock:
+            self.user_list_settings = await self.__load_user_list_settings()
 
     async def reload_article_translations(self) -> None:
         """Reload the article translations.
@@ -199,7 +587,13 @@ class Bring:
             If the request fails.
 
         """
+        async with self._settings_lock:
+            await self.__reload_article_translations()
+
+    async def __reload_article_translations(self) -> None:
+        """Reload the article translations, the caller holds the settings lock."""
         self.__translations = await self.__load_article_translations()
+        self.__inverse_translations = {}
 
     async def load_lists(self) -> BringListResponse:
         """Load all shopping lists.
@@ -219,48 +613,12 @@ class Bring:
             If the request fails due to invalid or expired authorization token.
 
         """
-        try:
-            url = self.url / "bringusers" / str(self.uuid) / "lists"
-            async with self._session.get(url, headers=self.headers) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = BringErrorResponse.from_json(await r.text())
-                    except (JSONDecodeError, aiohttp.ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:", exc_info=True
-                        )
-                    else:
-                        _LOGGER.debug("Exception: Cannot get lists: %s", errmsg.message)
-                    raise BringAuthException(
-                        "Loading lists failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-
-                r.raise_for_status()
-
-                try:
-                    return BringListResponse.from_json(await r.text())
-                except MissingField as e:
-                    raise BringMissingFieldException(e) from e
-                except JSONDecodeError as e:
-                    _LOGGER.debug("Exception: Cannot get lists:", exc_info=True)
-                    raise BringParseException(
-                        "Loading lists failed during parsing of request response."
-                    ) from e
-        except TimeoutError as e:
-            _LOGGER.debug("Exception: Cannot get lists:", exc_info=True)
-            raise BringRequestException(
-                "Loading lists failed due to connection timeout."
-            ) from e
-        except aiohttp.ClientError as e:
-            _LOGGER.debug("Exception: Cannot get lists:", exc_info=True)
-            raise BringRequestException(
-                "Loading lists failed due to request exception."
-            ) from e
+        return await self._get(
+            self._url_users / str(self.uuid) / "lists",
+            BringListResponse.from_json,
+            "lists",
+            coalesce=True,
+        )
 
     async def get_list(self, list_uuid: UUID) -> BringItemsResponse:
         """Get all items from a shopping list.
@@ -285,70 +643,19 @@ class Bring:
             If the request fails due to invalid or expired authorization token.
 
         """
-        try:
-            url = self.url / "v2/bringlists" / str(list_uuid)
-            async with self._session.get(url, headers=self.headers) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = BringErrorResponse.from_json(await r.text())
-                    except (JSONDecodeError, aiohttp.ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:", exc_info=True
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot get list items: %s", errmsg.message
-                        )
-                    raise BringAuthException(
-                        "Loading list items failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-
-                r.raise_for_status()
-
-                try:
-                    data = BringItemsResponse.from_json(await r.text())
+        data = await self._get(
+            self._url_lists_v2 / str(list_uuid),
+            BringItemsResponse.from_json,
+            "list items",
+            coalesce=True,
+        )
 
-                    for item in chain(data.items.purchase, data.items.recently):
-                        item.itemId = self.__translate(
-                            item.itemId,
-                            to_locale=self.__locale(list_uuid),
-                        )
-                except MissingField as e:
-                    raise BringMissingFieldException(e) from e
-                except (JSONDecodeError, KeyError) as e:
-                    _LOGGER.debug(
-                        "Exception: Cannot get items for list %s:",
-                        list_uuid,
-                        exc_info=True,
-                    )
-                    raise BringParseException(
-                        "Loading list items failed during parsing of request response."
-                    ) from e
-                else:
-                    return data
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot get items for list %s:",
-                list_uuid,
-                exc_info=True,
-            )
-            raise BringRequestException(
-                "Loading list items failed due to connection timeout."
-            ) from e
-        except aiohttp.ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot get items for list %s:",
-                list_uuid,
-                exc_info=True,
-            )
-            raise BringRequestException(
-                "Loading list items failed due to request exception."
-            ) from e
+        locale = self.__locale(list_uuid)
+        if locale != BRING_DEFAULT_LOCALE:
+            translations = self.__translation_table(locale)
+            for item in chain(data.items.purchase, data.items.recently):
+                item.itemId = translations.get(item.itemId, item.itemId)
+        return data
 
     async def get_all_item_details(
         self, list_uuid: str
@@ -379,62 +686,14 @@ class Bring:
             If the request fails due to invalid or expired authorization token.
 
         """
-        try:
-            url = self.url / "bringlists" / list_uuid / "details"
-            async with self._session.get(url, headers=self.headers) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = BringErrorResponse.from_json(await r.text())
-                    except (JSONDecodeError, aiohttp.ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:", exc_info=True
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot get list details: %s", errmsg.message
-                        )
-                    raise BringAuthException(
-                        "Loading list details failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-
-                r.raise_for_status()
-
-                try:
-                    return BringListItemsDetailsResponse.from_dict(
-                        {"items": orjson.loads(await r.text())}
-                    )
-                except JSONDecodeError as e:
-                    _LOGGER.debug(
-                        "Exception: Cannot get item details for list %s:",
-                        list_uuid,
-                        exc_info=True,
-                    )
-                    raise BringParseException(
-                        "Loading list details failed during parsing of request response."
-                    ) from e
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot get item details for list %s:",
-                list_uuid,
-                exc_info=True,
-            )
-            raise BringRequestException(
-                "Loading list details failed due to connection timeout."
-            ) from e
-        except aiohttp.ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot get item details for list %s:",
-                list_uuid,
-                exc_info=True,
-            )
-            raise BringRequestException(
-                "Loading list details failed due to request exception."
-            ) from e
+        return await self._get(
+            self._url_lists / list_uuid / "details",
+            lambda body: BringListItemsDetailsResponse.from_dict(
+                {"items": orjson.loads(body)}
+            ),
+            "list details",
+            coalesce=True,
+        )
 
     async def save_item(
         self,
@@ -475,7 +734,7 @@ class Bring:
             uuid=str(item_uuid) if item_uuid else None,
         )
         try:
-            return await self.batch_update_list(list_uuid, data, BringItemOperation.ADD)
+            return await self.__change_item(list_uuid, data, BringItemOperation.ADD)
         except BringRequestException as e:
             _LOGGER.debug(
                 "Exception: Cannot save item %s (%s) to list %s:",
@@ -531,7 +790,7 @@ class Bring:
             uuid=str(item_uuid) if item_uuid else None,
         )
         try:
-            return await self.batch_update_list(list_uuid, data, BringItemOperation.ADD)
+            return await self.__change_item(list_uuid, data, BringItemOperation.ADD)
         except BringRequestException as e:
             _LOGGER.debug(
                 "Exception: Cannot update item %s (%s) to list %s:",
@@ -577,9 +836,7 @@ class Bring:
             uuid=str(item_uuid) if item_uuid else None,
         )
         try:
-            return await self.batch_update_list(
-                list_uuid, data, BringItemOperation.REMOVE
-            )
+            return await self.__change_item(list_uuid, data, BringItemOperation.REMOVE)
         except BringRequestException as e:
             _LOGGER.debug(
                 "Exception: Cannot delete item %s from list %s:",
@@ -631,7 +888,7 @@ class Bring:
             uuid=str(item_uuid) if item_uuid else None,
         )
         try:
-            return await self.batch_update_list(
+            return await self.__change_item(
                 list_uuid, data, BringItemOperation.COMPLETE
             )
         except BringRequestException as e:
@@ -646,6 +903,78 @@ class Bring:
                 "failed due to request exception."
             ) from e
 
+    async def __change_item(
+        self, list_uuid: UUID, item: BringItem, operation: BringItemOperation
+    ) -> aiohttp.ClientResponse:
+        """Send a single item change or queue it for the next batch.
+
+        Without a `batch_window` the change is sent right away. Otherwise it is
+        queued and sent together with all changes made within the window, the
+        shared response of the batch request is returned.
+        """
+        if self.batch_window is None:
+            return await self.batch_update_list(list_uuid, item, operation)
+
+        item["operation"] = operation
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[aiohttp.ClientResponse] = loop.create_future()
+        self._pending_changes.setdefault(list_uuid, []).append((item, future))
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                self.batch_window, self.__schedule_flush
+            )
+        return await future
+
+    def __schedule_flush(self) -> None:
+        """Start sending the queued item changes."""
+        self._flush_handle = None
+        self._flush_task = asyncio.get_running_loop().create_task(self.flush())
+
+    async def flush(self) -> None:
+        """Send all queued item changes.
+
+        Item changes are only queued if the instance was created with a
+        `batch_window`. Changes are sent as one batch request per list. A batch
+        already being sent after the window ended is awaited as well.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending_changes = self._pending_changes, {}
+        in_flight = self._flush_task
+        await asyncio.gather(
+            *(
+                self.__send_changes(list_uuid, changes)
+                for list_uuid, changes in pending.items()
+            )
+        )
+        if in_flight is not None and in_flight is not asyncio.current_task():
+            # Wait without propagating the cancellation of this call.
+            await asyncio.wait([in_flight])
+
+    async def __send_changes(
+        self,
+        list_uuid: UUID,
+        changes: list[tuple[BringItem, asyncio.Future[aiohttp.ClientResponse]]],
+    ) -> None:
+        """Send queued item changes of a list and resolve their futures."""
+        try:
+            r = await self.batch_update_list(list_uuid, [item for item, _ in changes])
+        except Exception as e:
+            for _, future in changes:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for _, future in changes:
+                if not future.done():
+                    future.set_result(r)
+        finally:
+            # The changes have left the queue, don't leave their callers
+            # waiting forever if sending them was cancelled.
+            for _, future in changes:
+                if not future.done():
+                    future.cancel()
+
     async def notify(
         self,
         list_uuid: UUID,
@@ -681,73 +1010,32 @@ class Bring:
             If the value for item_name is invalid.
 
         """
-        json_data = BringNotificationsConfigType(
-            arguments=[],
-            listNotificationType=notification_type.value,
-            senderPublicUserUuid=str(self.public_uuid),
-        )
-
+        notification = notification_type.value
         if not isinstance(notification_type, BringNotificationType):
             raise TypeError(
                 f"notificationType {notification_type} not supported,"
                 "must be of type BringNotificationType."
             )
+        arguments = []
         if notification_type is BringNotificationType.URGENT_MESSAGE:
-            if not item_name or len(item_name) == 0:
+            if not item_name:
                 raise ValueError(
                     "notificationType is URGENT_MESSAGE but argument itemName missing."
                 )
+            arguments.append(item_name)
 
-            json_data["arguments"] = [item_name]
-        try:
-            url = self.url / "v2/bringnotifications/lists" / str(list_uuid)
-            async with self._session.post(
-                url, headers=self.headers, json=json_data
-            ) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = BringErrorResponse.from_json(await r.text())
-                    except (JSONDecodeError, aiohttp.ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:", exc_info=True
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot send notification: %s", errmsg.message
-                        )
-                    raise BringAuthException(
-                        "Sending notification failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
+        json_data = BringNotificationsConfigType(
+            arguments=arguments,
+            listNotificationType=notification,
+            senderPublicUserUuid=str(self.public_uuid),
+        )
 
-                r.raise_for_status()
-                return r
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot send notification %s for list %s:",
-                notification_type,
-                list_uuid,
-                exc_info=True,
-            )
-            raise BringRequestException(
-                f"Sending notification {notification_type} for list {list_uuid}"
-                "failed due to connection timeout."
-            ) from e
-        except aiohttp.ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot send notification %s for list %s:",
-                notification_type,
-                list_uuid,
-                exc_info=True,
-            )
-            raise BringRequestException(
-                f"Sending notification {notification_type} for list {list_uuid}"
-                "failed due to request exception."
-            ) from e
+        return await self._send(
+            "POST",
+            self._url_notifications / str(list_uuid),
+            f"Sending notification {notification} for list {list_uuid}",
+            json=json_data,
+        )
 
     async def does_user_exist(self, mail: str | None = None) -> bool:
         """Check if e-mail is valid and user exists.
@@ -777,12 +1065,16 @@ class Bring:
         if not mail:
             raise ValueError("Argument mail missing.")
 
+        if not _EMAIL_RE.fullmatch(mail):
+            raise BringEMailInvalidException(f"E-mail {mail} is invalid.")
+
         try:
-            url = self.url / "bringusers" % {"email": mail}
-            async with self._session.get(url, headers=self.headers) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
+            url = self._url_users % {"email": mail}
+            async with self._request("GET", url, headers=self.headers) as r:
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Response from %s [%s]: %s", url, r.status, await r.text()
+                    )
 
                 if r.status == HTTPStatus.NOT_FOUND:
                     raise BringUserUnknownException(f"User {mail} does not exist.")
@@ -804,6 +1096,9 @@ class Bring:
     def __load_article_translations_from_file(self, locale: str) -> dict[str, str]:
         """Read localization ressource files from disk.
 
+        The files are bundled with the package and never change, the parsed
+        tables are cached and shared between all Bring instances.
+
         Parameters
         ----------
         locale : str
@@ -815,20 +1110,99 @@ class Bring:
                 A translation table as a dict
 
         """
-        dictionary_from_file: dict[str, str]
+        return _read_article_translations(locale)
 
-        path = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)),
-            "locales",
-            f"articles.{locale}.json",
+    def __required_locales(self) -> list[str]:
+        """Collect the locales that need a translation dictionary.
+
+        Returns
+        -------
+        list[str]
+            The supported locales of the user and their lists, without the
+            default locale.
+
+        """
+        seen = {BRING_DEFAULT_LOCALE}
+        locales: list[str] = []
+        for locale in chain(
+            (
+                list_setting.get("listArticleLanguage", self.user_locale)
+                for list_setting in self.user_list_settings.values()
+            ),
+            (self.user_locale,),
+        ):
+            if locale not in seen:
+                seen.add(locale)
+                if locale in BRING_SUPPORTED_LOCALES:
+                    locales.append(locale)
+        return locales
+
+    async def __load_article_translations(self) -> dict[str, dict[str, str]]:
+        """Load all required translation dictionaries into memory.
+
+        Raises
+        ------
+        BringRequestException
+            If the request fails.
+        BringParseException
+            If the parsing of the request response fails.
+
+        Returns
+        -------
+        dict
+            dict of downloaded dictionaries
+
+        """
+        locales = self.__required_locales()
+        dictionaries = await asyncio.gather(
+            *(self.__load_article_translations_for_locale(locale) for locale in locales)
         )
-        with open(path, encoding="UTF-8") as f:
-            dictionary_from_file = json.load(f)
+        return dict(zip(locales, dictionaries, strict=True))
+
+    async def __load_article_translations_for_locale(
+        self, locale: str
+    ) -> dict[str, str]:
+        """Load the translation dictionary for a locale from disk or download it.
+
+        Parameters
+        ----------
+        locale : str
+            A locale string
+
+        Raises
+        ------
+        BringRequestException
+            If the request fails.
+        BringParseException
+            If the parsing of the request response fails.
+
+        Returns
+        -------
+        dict[str, str]
+            A translation table as a dict
+
+        """
+        try:
+            if locale in _article_translations:
+                return self.__load_article_translations_from_file(locale)
+            return await asyncio.to_thread(
+                self.__load_article_translations_from_file, locale
+            )
+        except OSError:
+            _LOGGER.warning(
+                "Locale file articles.%s.json could not be loaded from filesystem. "
+                "Will continue trying to download locale.",
+                locale,
+            )
+        return await self.__download_article_translations(locale)
 
-        return dictionary_from_file
+    async def __download_article_translations(self, locale: str) -> dict[str, str]:
+        """Download the translation dictionary for a locale.
 
-    async def __load_article_translations(self) -> dict[str, dict[str, str]]:
-        """Load all required translation dictionaries into memory.
+        Parameters
+        ----------
+        locale : str
+            A locale string
 
         Raises
         ------
@@ -839,133 +1213,94 @@ class Bring:
 
         Returns
         -------
-        dict
-            dict of downloaded dictionaries
+        dict[str, str]
+            A translation table as a dict
 
         """
-        dictionaries: dict[str, dict[str, str]] = {}
-
-        locales_required = list(
-            dict.fromkeys(
-                [
-                    list_setting.get("listArticleLanguage", self.user_locale)
-                    for list_setting in self.user_list_settings.values()
-                ]
-                + [self.user_locale]
-            )
-        )
-
-        for locale in locales_required:
-            if locale == BRING_DEFAULT_LOCALE or locale not in BRING_SUPPORTED_LOCALES:
-                continue
-
-            try:
-                dictionaries[locale] = await self.loop.run_in_executor(
-                    None, self.__load_article_translations_from_file, locale
-                )
-                continue
-            except OSError:
-                _LOGGER.warning(
-                    "Locale file articles.%s.json could not be loaded from filesystem. "
-                    "Will continue trying to download locale.",
-                    locale,
-                )
+        dictionary: dict[str, str]
 
-            try:
-                url = URL(LOCALES_BASE_URL) / f"articles.{locale}.json"
-                async with self._session.get(url) as r:
-                    _LOGGER.debug("Response from %s [%s]", url, r.status)
-                    r.raise_for_status()
+        try:
+            url = self._url_locales / f"articles.{locale}.json"
+            async with self._request("GET", url) as r:
+                _LOGGER.debug("Response from %s [%s]", url, r.status)
+                r.raise_for_status()
 
-                    try:
-                        dictionaries[locale] = await r.json()
-                    except JSONDecodeError as e:
-                        _LOGGER.debug(
-                            "Exception: Cannot load articles.%s.json:",
-                            locale,
-                            exc_info=True,
-                        )
-                        raise BringParseException(
-                            f"Loading article translations for locale {locale} "
-                            "failed during parsing of request response."
-                        ) from e
-            except TimeoutError as e:
-                _LOGGER.debug(
-                    "Exception: Cannot load articles.%s.json:", locale, exc_info=True
-                )
-                raise BringRequestException(
-                    f"Loading article translations for locale {locale} "
-                    "failed due to connection timeout."
-                ) from e
+                try:
+                    dictionary = orjson.loads(await r.read())
+                except JSONDecodeError as e:
+                    _LOGGER.debug(
+                        "Exception: Cannot load articles.%s.json:",
+                        locale,
+                        exc_info=True,
+                    )
+                    raise BringParseException(
+                        f"Loading article translations for locale {locale} "
+                        "failed during parsing of request response."
+                    ) from e
+        except TimeoutError as e:
+            _LOGGER.debug(
+                "Exception: Cannot load articles.%s.json:", locale, exc_info=True
+            )
+            raise BringRequestException(
+                f"Loading article translations for locale {locale} "
+                "failed due to connection timeout."
+            ) from e
 
-            except aiohttp.ClientError as e:
-                _LOGGER.debug(
-                    "Exception: Cannot load articles.%s.json:", locale, exc_info=True
-                )
-                raise BringRequestException(
-                    f"Loading article translations for locale {locale} "
-                    "failed due to request exception."
-                ) from e
+        except aiohttp.ClientError as e:
+            _LOGGER.debug(
+                "Exception: Cannot load articles.%s.json:", locale, exc_info=True
+            )
+            raise BringRequestException(
+                f"Loading article translations for locale {locale} "
+                "failed due to request exception."
+            ) from e
 
-        return dictionaries
+        return dictionary
 
-    def __translate(
-        self,
-        item_id: str,
-        *,
-        to_locale: str | None = None,
-        from_locale: str | None = None,
-    ) -> str:
-        """Translate a catalog item from or to a language.
+    def __translation_table(
+        self, locale: str, *, inverse: bool = False
+    ) -> dict[str, str]:
+        """Get the translation dictionary of a locale.
 
         Parameters
         ----------
-        item_id : str
-            Item name.
-        to_locale : str
-            locale to translate to.
-        from_locale : str
-            locale to translate from.
+        locale : str
+            locale of the dictionary.
+        inverse : bool, optional
+            Get the dictionary translating from the locale instead of to it.
 
         Returns
         -------
-        str
-            Translated Item name.
+        dict[str, str]
+            The translation dictionary.
 
         Raises
         ------
+        ValueError
+            If the locale is not supported by Bring.
         BringTranslationException
-            If the translation fails.
+            If the translation dictionary is not loaded.
 
         """
-
-        locale = to_locale or from_locale
-
-        if locale == BRING_DEFAULT_LOCALE:
-            return item_id
-
-        if not locale:
-            raise ValueError("One of the arguments from_locale or to_locale required.")
-
         if locale not in BRING_SUPPORTED_LOCALES:
             _LOGGER.debug("Locale %s not supported by Bring.", locale)
             raise ValueError(f"Locale {locale} not supported by Bring.")
-        try:
-            return (
-                self.__translations[locale].get(item_id, item_id)
-                if to_locale
-                else (
-                    {value: key for key, value in self.__translations[locale].items()}
-                ).get(item_id, item_id)
-            )
-
-        except Exception as e:
-            _LOGGER.debug(
-                "Exception: Cannot load translation dictionary:", exc_info=True
-            )
+        translations = self.__translations.get(locale)
+        if translations is None:
+            _LOGGER.debug("Exception: Cannot load translation dictionary %s.", locale)
             raise BringTranslationException(
                 "Translation failed due to error loading translation dictionary."
-            ) from e
+            )
+
+        if not inverse:
+            return translations
+
+        table = self.__inverse_translations.get(locale)
+        if table is None:
+            table = self.__inverse_translations[locale] = {
+                value: key for key, value in translations.items()
+            }
+        return table
 
     async def __load_user_list_settings(self) -> dict[str, dict[str, str]]:
         """Load user list settings into memory.
@@ -992,7 +1327,7 @@ class Bring:
                 ).userlistsettings
             }
 
-        except Exception as e:
+        except (BringException, BringMissingFieldException) as e:
             _LOGGER.debug("Exception: Cannot load user list settings:", exc_info=True)
             raise BringTranslationException(
                 "Translation failed due to error loading user list settings."
@@ -1017,63 +1352,11 @@ class Bring:
             If the request fails due to invalid or expired authorization token.
 
         """
-        try:
-            url = self.url / "bringusersettings" / str(self.uuid)
-            async with self._session.get(url, headers=self.headers) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = BringErrorResponse.from_json(await r.text())
-                    except (JSONDecodeError, aiohttp.ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:", exc_info=True
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot get user settings: %s", errmsg.message
-                        )
-                    raise BringAuthException(
-                        "Loading user settings failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-
-                r.raise_for_status()
-
-                try:
-                    return BringUserSettingsResponse.from_json(await r.text())
-                except MissingField as e:
-                    raise BringMissingFieldException(e) from e
-                except JSONDecodeError as e:
-                    _LOGGER.debug(
-                        "Exception: Cannot get user settings for uuid %s:",
-                        self.uuid,
-                        exc_info=True,
-                    )
-                    raise BringParseException(
-                        "Loading user settings failed during parsing of request response."
-                    ) from e
-
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot get user settings for uuid %s:",
-                self.uuid,
-                exc_info=True,
-            )
-            raise BringRequestException(
-                "Loading user settings failed due to connection timeout."
-            ) from e
-        except aiohttp.ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot get user settings for uuid %s:",
-                self.uuid,
-                exc_info=True,
-            )
-            raise BringRequestException(
-                "Loading user settings failed due to request exception."
-            ) from e
+        return await self._get(
+            self._url_user_settings / str(self.uuid),
+            BringUserSettingsResponse.from_json,
+            "user settings",
+        )
 
     def __locale(self, list_uuid: UUID) -> str:
         """Get list or user locale.
@@ -1089,10 +1372,8 @@ class Bring:
             If list locale could not be determined from the userlistsettings or user.
 
         """
-        if str(list_uuid) in self.user_list_settings:
-            return self.user_list_settings[str(list_uuid)].get(
-                "listArticleLanguage", self.user_locale
-            )
+        if settings := self.user_list_settings.get(str(list_uuid)):
+            return settings.get("listArticleLanguage", self.user_locale)
         return self.user_locale
 
     def map_user_language_to_locale(self, user_locale: UserLocale) -> str:
@@ -1145,52 +1426,11 @@ class Bring:
             If the request fails due to invalid or expired authorization token.
 
         """
-        try:
-            url = self.url / "v2/bringusers" / str(self.uuid)
-            async with self._session.get(url, headers=self.headers) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = BringErrorResponse.from_json(await r.text())
-                    except (JSONDecodeError, aiohttp.ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:", exc_info=True
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot get current user settings: %s",
-                            errmsg.message,
-                        )
-                    raise BringAuthException(
-                        "Loading current user settings failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-
-                r.raise_for_status()
-
-                try:
-                    return BringSyncCurrentUserResponse.from_json(await r.text())
-                except MissingField as e:
-                    raise BringMissingFieldException(e) from e
-                except JSONDecodeError as e:
-                    _LOGGER.debug("Exception: Cannot get lists:", exc_info=True)
-                    raise BringParseException(
-                        "Loading lists failed during parsing of request response."
-                    ) from e
-
-        except TimeoutError as e:
-            _LOGGER.debug("Exception: Cannot get current user settings:", exc_info=True)
-            raise BringRequestException(
-                "Loading current user settings failed due to connection timeout."
-            ) from e
-        except aiohttp.ClientError as e:
-            _LOGGER.debug("Exception: Cannot  current user settings:", exc_info=True)
-            raise BringRequestException(
-                "Loading current user settings failed due to request exception."
-            ) from e
+        return await self._get(
+            self._url_users_v2 / str(self.uuid),
+            BringSyncCurrentUserResponse.from_json,
+            "current user settings",
+        )
 
     async def batch_update_list(
         self,
@@ -1227,79 +1467,39 @@ class Bring:
             If the request fails due to invalid or expired authorization token.
 
         """
-        if operation is None:
-            operation = BringItemOperation.ADD
-
-        _base_params = {
-            "accuracy": "0.0",
-            "altitude": "0.0",
-            "latitude": "0.0",
-            "longitude": "0.0",
-        }
+        default_operation = str(operation or BringItemOperation.ADD)
+
         if isinstance(items, dict):
             items = [items]
+        locale = self.__locale(list_uuid)
+        translations = (
+            {}
+            if locale == BRING_DEFAULT_LOCALE
+            else self.__translation_table(locale, inverse=True)
+        )
         json_data = {
             "changes": [
                 {
-                    **_base_params,
+                    **_ITEM_CHANGE_LOCATION,
                     **item,
-                    "itemId": self.__translate(
-                        item["itemId"],
-                        from_locale=self.__locale(list_uuid),
+                    "itemId": translations.get(item["itemId"], item["itemId"]),
+                    "operation": (
+                        str(item["operation"])
+                        if "operation" in item
+                        else default_operation
                     ),
-                    "operation": str(item.get("operation", operation)),
                 }
                 for item in items
             ],
             "sender": "",
         }
 
-        try:
-            url = self.url / "v2/bringlists" / str(list_uuid) / "items"
-            async with self._session.put(
-                url, headers=self.headers, json=json_data
-            ) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = BringErrorResponse.from_json(await r.text())
-                    except (JSONDecodeError, aiohttp.ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:", exc_info=True
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot get execute batch operation: %s",
-                            errmsg.message,
-                        )
-                    raise BringAuthException(
-                        "Batch operation failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-
-                r.raise_for_status()
-                return r
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot execute batch operations for list %s:",
-                list_uuid,
-                exc_info=True,
-            )
-            raise BringRequestException(
-                f"Batch operation for list {list_uuid} failed due to connection timeout."
-            ) from e
-        except aiohttp.ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot execute batch operations for %s:",
-                list_uuid,
-                exc_info=True,
-            )
-            raise BringRequestException(
-                f"Batch operation for list {list_uuid} failed due to request exception."
-            ) from e
+        return await self._send(
+            "PUT",
+            self._url_lists_v2 / str(list_uuid) / "items",
+            f"Batch operation for list {list_uuid}",
+            json=json_data,
+        )
 
     async def retrieve_new_access_token(
         self, refresh_token: str | None = None
@@ -1326,23 +1526,44 @@ class Bring:
         """
         refresh_token = refresh_token or self.refresh_token
 
+        if (
+            self._token_refresh is None
+            or self._token_refresh[0] != refresh_token
+            or self._token_refresh[1].done()
+        ):
+            task = asyncio.get_running_loop().create_task(
+                self.__retrieve_new_access_token(refresh_token)
+            )
+            task.add_done_callback(_retrieve_exception)
+            self._token_refresh = (refresh_token, task)
+        return await asyncio.shield(self._token_refresh[1])
+
+    async def __retrieve_new_access_token(
+        self, refresh_token: str
+    ) -> BringAuthTokenResponse:
+        """Request a new access token and update the authorization header.
+
+        Concurrent calls of retrieve_new_access_token with the same refresh
+        token share a single request.
+        """
         user_data = {"grant_type": "refresh_token", "refresh_token": refresh_token}
         try:
-            url = self.url / "v2/bringauth/token"
-            async with self._session.post(
-                url, headers=self.headers, data=user_data
+            url = self._url_token
+            async with self._request(
+                "POST", url, headers=self.headers, data=user_data
             ) as r:
+                body = await r.read()
                 _LOGGER.debug(
                     "Response from %s [%s]: %s",
                     url,
                     r.status,
-                    await r.text()
+                    body.decode(errors="replace")
                     if r.status != 200
                     else "",  # do not log response on success, as it contains sensible data
                 )
                 if r.status == HTTPStatus.UNAUTHORIZED:
                     try:
-                        errmsg = BringErrorResponse.from_json(await r.text())
+                        errmsg = BringErrorResponse.from_json(body)
                     except (JSONDecodeError, aiohttp.ClientError):
                         _LOGGER.debug(
                             "Exception: Cannot parse token request response:",
@@ -1361,7 +1582,7 @@ class Bring:
                 r.raise_for_status()
 
                 try:
-                    data = BringAuthTokenResponse.from_json(await r.text())
+                    data = BringAuthTokenResponse.from_json(body)
                 except MissingField as e:
                     raise BringMissingFieldException(e) from e
                 except JSONDecodeError as e:
@@ -1384,6 +1605,7 @@ class Bring:
 
         self.headers["Authorization"] = f"{data.token_type} {data.access_token}"
         self.expires_in = data.expires_in
+        self._pending_gets.clear()
 
         return data
 
@@ -1418,103 +1640,44 @@ class Bring:
             raise ValueError(f"Language {language} not supported.")
 
         url = (
-            self.url
-            / "bringusersettings"
+            self._url_user_settings
             / str(self.uuid)
             / str(list_uuid)
             / "listArticleLanguage"
         )
 
-        data = {"value": language}
-        try:
-            async with self._session.post(url, headers=self.headers, data=data) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    raise BringAuthException(
-                        "Set list article language failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-                r.raise_for_status()
+        r = await self._send(
+            "POST",
+            url,
+            f"Setting article language to {language} for list {list_uuid}",
+            data={"value": language},
+        )
+        self._settings_stale = True
+        await self.__refresh_list_settings()
+        return r
+
+    async def __refresh_list_settings(self) -> None:
+        """Reload the list settings and translations after a settings change.
+
+        Concurrent callers share one reload. A change made while a reload is
+        already fetching marks the settings stale again and triggers another.
+        """
+        async with self._settings_lock:
+            if not self._settings_stale:
+                return
+            self._settings_stale = False
+            try:
                 self.user_list_settings = await self.__load_user_list_settings()
-                self.__translations = await self.__load_article_translations()
-                return r
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot set article language to %s for list %s:",
-                language,
-                list_uuid,
-                exc_info=True,
-            )
-            raise BringRequestException(
-                "Set list article language failed due to connection timeout."
-            ) from e
-        except aiohttp.ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot set article language to %s for list %s:",
-                language,
-                list_uuid,
-                exc_info=True,
-            )
-            raise BringRequestException(
-                "Set list article language failed due to request exception."
-            ) from e
+                if not self.__translations.keys() >= set(self.__required_locales()):
+                    await self.__reload_article_translations()
+            except BaseException:
+                self._settings_stale = True
+                raise
 
     async def get_activity(self, list_uuid: UUID) -> BringActivityResponse:
         """Get activity for given list."""
-        try:
-            url = self.url / "v2/bringlists" / str(list_uuid) / "activity"
-            async with self._session.get(url, headers=self.headers) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = await r.json()
-                    except (JSONDecodeError, aiohttp.ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:", exc_info=True
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot get list activity: %s", errmsg["message"]
-                        )
-                    raise BringAuthException(
-                        "Loading list activity failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-
-                r.raise_for_status()
-
-                try:
-                    return BringActivityResponse.from_json(await r.text())
-                except MissingField as e:
-                    raise BringMissingFieldException(e) from e
-                except (JSONDecodeError, KeyError) as e:
-                    _LOGGER.debug(
-                        "Exception: Cannot get activity for list %s:",
-                        list_uuid,
-                        exc_info=True,
-                    )
-                    raise BringParseException(
-                        "Loading list activity failed during parsing of request response."
-                    ) from e
-
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot get activity for list %s:",
-                list_uuid,
-                exc_info=True,
-            )
-            raise BringRequestException(
-                "Loading list activity failed due to connection timeout."
-            ) from e
-        except aiohttp.ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot get activity for list %s:", list_uuid, exc_info=True
-            )
-            raise BringRequestException(
-                "Loading list activity failed due to request exception."
-            ) from e
+        return await self._get(
+            self._url_lists_v2 / str(list_uuid) / "activity",
+            BringActivityResponse.from_json,
+            "list activity",
+        )
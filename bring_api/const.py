@@ -1,7 +1,10 @@
 """Constants for bring-api."""
 
+from http import HTTPStatus
 from typing import Final
 
+import aiohttp
+
 API_BASE_URL: Final = "https://api.getbring.com/rest/"
 DEFAULT_HEADERS: Final = {
     "Authorization": "Bearer",
@@ -14,28 +17,30 @@ DEFAULT_HEADERS: Final = {
 }
 
 LOCALES_BASE_URL: Final = "https://web.getbring.com/locale/"
-BRING_SUPPORTED_LOCALES: Final = [
-    "de-AT",
-    "de-CH",
-    "de-DE",
-    "en-AU",
-    "en-CA",
-    "en-GB",
-    "en-US",
-    "es-ES",
-    "fr-CH",
-    "fr-FR",
-    "hu-HU",
-    "it-CH",
-    "it-IT",
-    "nb-NO",
-    "nl-NL",
-    "pl-PL",
-    "pt-BR",
-    "ru-RU",
-    "sv-SE",
-    "tr-TR",
-]
+BRING_SUPPORTED_LOCALES: Final = frozenset(
+    {
+        "de-AT",
+        "de-CH",
+        "de-DE",
+        "en-AU",
+        "en-CA",
+        "en-GB",
+        "en-US",
+        "es-ES",
+        "fr-CH",
+        "fr-FR",
+        "hu-HU",
+        "it-CH",
+        "it-IT",
+        "nb-NO",
+        "nl-NL",
+        "pl-PL",
+        "pt-BR",
+        "ru-RU",
+        "sv-SE",
+        "tr-TR",
+    }
+)
 
 MAP_LANG_TO_LOCALE = {
     "de": "de-DE",
@@ -54,3 +59,18 @@ MAP_LANG_TO_LOCALE = {
 }
 
 BRING_DEFAULT_LOCALE: Final = "de-CH"
+
+REQUEST_TIMEOUT: Final = aiohttp.ClientTimeout(
+    total=30, connect=10, sock_connect=10, sock_read=30
+)
+REQUEST_RETRY_ATTEMPTS: Final = 3
+REQUEST_RETRY_BACKOFF: Final = 1.0
+REQUEST_RETRY_MAX_DELAY: Final = 30.0
+REQUEST_RETRY_METHODS: Final = frozenset({"GET"})
+REQUEST_RETRY_STATUSES: Final = frozenset(
+    {
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    }
+)
@@ -1,5 +1,14 @@
 """Bring API exceptions."""
 
+__all__ = [
+    "BringAuthException",
+    "BringEMailInvalidException",
+    "BringParseException",
+    "BringRequestException",
+    "BringTranslationException",
+    "BringUserUnknownException",
+]
+
 
 class BringException(Exception):
     """General exception occurred."""
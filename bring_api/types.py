@@ -8,6 +8,24 @@ from uuid import UUID
 
 from mashumaro.mixins.orjson import DataClassORJSONMixin
 
+__all__ = [
+    "BringActivityResponse",
+    "BringAuthResponse",
+    "BringAuthTokenResponse",
+    "BringItem",
+    "BringItemOperation",
+    "BringItemsResponse",
+    "BringListItemDetails",
+    "BringListItemsDetailsResponse",
+    "BringListResponse",
+    "BringNotificationsConfigType",
+    "BringNotificationType",
+    "BringSyncCurrentUserResponse",
+    "BringUserListSettingEntry",
+    "BringUserSettingsEntry",
+    "BringUserSettingsResponse",
+]
+
 
 @dataclass(kw_only=True)
 class BringList(DataClassORJSONMixin):
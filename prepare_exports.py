@@ -0,0 +1,78 @@
+"""Generate the package exports in bring_api/__init__.py.
+
+The public names are collected from the `__all__` of the submodules listed below.
+Exceptions are imported eagerly, the client and the types are resolved lazily on
+first access. After adding, removing or renaming a public name in one of these
+submodules run `python prepare_exports.py` to update bring_api/__init__.py.
+"""
+
+import importlib
+import os
+import re
+
+BEGIN = "# BEGIN GENERATED EXPORTS (prepare_exports.py)\n"
+END = "# END GENERATED EXPORTS\n"
+
+EAGER_MODULE = ".exceptions"
+LAZY_MODULES = (".bring", ".types")
+
+
+def public_names(mod_name: str) -> list[str]:
+    """Return the sorted __all__ of a bring_api submodule."""
+    module = importlib.import_module(mod_name, "bring_api")
+    return sorted(module.__all__, key=str.lower)
+
+
+def import_block(mod_name: str, names: list[str], indent: str = "") -> str:
+    """Render a from-import statement formatted like ruff does."""
+    if indent and len(names) == 1:
+        return f"{indent}from {mod_name} import {names[0]}\n"
+    lines = "".join(f"{indent}    {name},\n" for name in names)
+    return f"{indent}from {mod_name} import (\n{lines}{indent})\n"
+
+
+def render() -> str:
+    """Render the generated section of bring_api/__init__.py."""
+    eager = public_names(EAGER_MODULE)
+    lazy = {mod_name: public_names(mod_name) for mod_name in LAZY_MODULES}
+    lazy_table = sorted(
+        ((name, mod_name) for mod_name, names in lazy.items() for name in names),
+        key=lambda entry: entry[0].lower(),
+    )
+    all_names = sorted(eager + [name for name, _ in lazy_table], key=str.lower)
+
+    return "".join(
+        [
+            BEGIN,
+            import_block(EAGER_MODULE, eager),
+            "\nif TYPE_CHECKING:\n",
+            *(
+                import_block(mod_name, names, indent="    ")
+                for mod_name, names in lazy.items()
+            ),
+            "\n__all__ = (\n",
+            *(f'    "{name}",\n' for name in all_names),
+            ")\n\n_LAZY = MappingProxyType(\n    {\n",
+            *(f'        "{name}": "{mod_name}",\n' for name, mod_name in lazy_table),
+            "    }\n)\n",
+            END,
+        ]
+    )
+
+
+path = os.path.join("bring_api", "__init__.py")
+with open(path, encoding="utf-8") as f:
+    source = f.read()
+
+if BEGIN not in source or END not in source:
+    raise SystemExit(f"Markers for generated exports not found in {path}.")
+
+source = re.sub(
+    f"{re.escape(BEGIN)}.*?{re.escape(END)}",
+    lambda _: render(),
+    source,
+    flags=re.DOTALL,
+)
+
+with open(path, "w", encoding="utf-8") as f:
+    f.write(source)
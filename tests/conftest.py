@@ -230,6 +230,12 @@ async def bring_api_client(session) -> Bring:
     return bring
 
 
+@pytest.fixture(autouse=True)
+def no_retry_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Retry failed requests without waiting."""
+    monkeypatch.setattr("bring_api.bring.REQUEST_RETRY_BACKOFF", 0)
+
+
 @pytest.fixture(name="mocked")
 def aioclient_mock():
     """Mock Aiohttp client requests."""
@@ -2,17 +2,28 @@
 
 import asyncio
 import enum
+import gc
 from http import HTTPStatus
+import importlib
 import time
+from unittest import mock
 import uuid
 
 import aiohttp
 from dotenv import load_dotenv
+import orjson
 import pytest
 from syrupy.assertion import SnapshotAssertion
+from yarl import URL
 
+import bring_api
 from bring_api.bring import Bring
-from bring_api.const import BRING_SUPPORTED_LOCALES, DEFAULT_HEADERS
+from bring_api.const import (
+    BRING_SUPPORTED_LOCALES,
+    DEFAULT_HEADERS,
+    REQUEST_RETRY_MAX_DELAY,
+    REQUEST_TIMEOUT,
+)
 from bring_api.exceptions import (
     BringAuthException,
     BringEMailInvalidException,
@@ -47,11 +58,6 @@ from .conftest import (
 load_dotenv()
 
 
-def mocked_translate(bring: Bring, item_id: str, *args, **kwargs) -> str:
-    """Mock __translate method."""
-    return item_id
-
-
 class TestHeadersSerializing:
     """Test headers serializing functions."""
 
@@ -74,21 +80,42 @@ class TestHeadersSerializing:
         assert len(headers) > 0, "Headers are not correctly serialized"
         assert "X-BRING-API-KEY" in headers, "Headers do not contain X-BRING-API-KEY"
 
+    async def test_instance_headers_serialize(self, bring) -> None:
+        """Test serializing the headers of a Bring instance."""
+
+        headers = headers_deserialize(headers_serialize(bring.headers))
+
+        assert headers == bring.headers
+
 
 class TestDoesUserExist:
     """Tests for does_user_exist method."""
 
     async def test_mail_invalid(self, mocked, bring):
         """Test does_user_exist for invalid e-mail."""
-        mocked.get("https://api.getbring.com/rest/bringusers?email=EMAIL", status=400)
+        mocked.get(
+            "https://api.getbring.com/rest/bringusers?email=user@example.com",
+            status=400,
+        )
         with pytest.raises(BringEMailInvalidException):
-            await bring.does_user_exist("EMAIL")
+            await bring.does_user_exist("user@example.com")
+
+    @pytest.mark.parametrize("mail", ["EMAIL", "user@example", "user name@example.com"])
+    async def test_mail_malformed(self, mocked, bring, mail):
+        """Test does_user_exist rejects malformed e-mails without a request."""
+        with pytest.raises(BringEMailInvalidException):
+            await bring.does_user_exist(mail)
+
+        assert not mocked.requests
 
     async def test_unknown_user(self, mocked, bring):
         """Test does_user_exist for unknown user."""
-        mocked.get("https://api.getbring.com/rest/bringusers?email=EMAIL", status=404)
+        mocked.get(
+            "https://api.getbring.com/rest/bringusers?email=user@example.com",
+            status=404,
+        )
         with pytest.raises(BringUserUnknownException):
-            await bring.does_user_exist("EMAIL")
+            await bring.does_user_exist("user@example.com")
 
     async def test_mail_value_error(self, mocked, bring, monkeypatch):
         """Test does_user_exist for unknown user."""
@@ -103,14 +130,16 @@ class TestDoesUserExist:
     async def test_user_exist_with_parameter(self, mocked, bring):
         """Test does_user_exist for known user."""
         mocked.get(
-            "https://api.getbring.com/rest/bringusers?email=EMAIL", status=HTTPStatus.OK
+            "https://api.getbring.com/rest/bringusers?email=user@example.com",
+            status=HTTPStatus.OK,
         )
-        assert await bring.does_user_exist("EMAIL") is True
+        assert await bring.does_user_exist("user@example.com") is True
 
-    async def test_user_exist_without_parameter(self, mocked, bring):
+    async def test_user_exist_without_parameter(self, mocked, bring, monkeypatch):
         """Test does_user_exist for known user."""
+        monkeypatch.setattr(bring, "mail", "user@example.com")
         mocked.get(
-            "https://api.getbring.com/rest/bringusers?email=EMAIL",
+            "https://api.getbring.com/rest/bringusers?email=user@example.com",
             status=HTTPStatus.OK,
         )
         assert await bring.does_user_exist() is True
@@ -126,12 +155,13 @@ class TestDoesUserExist:
         """Test request exceptions."""
 
         mocked.get(
-            "https://api.getbring.com/rest/bringusers?email=EMAIL",
+            "https://api.getbring.com/rest/bringusers?email=user@example.com",
             exception=exception,
+            repeat=True,
         )
 
         with pytest.raises(expected):
-            await bring.does_user_exist("EMAIL")
+            await bring.does_user_exist("user@example.com")
 
 
 class TestLogin:
@@ -292,12 +322,27 @@ class TestLoadLists:
         mocked.get(
             f"https://api.getbring.com/rest/bringusers/{UUID}/lists",
             exception=exception,
+            repeat=True,
         )
         monkeypatch.setattr(bring, "uuid", UUID)
 
         with pytest.raises(BringRequestException):
             await bring.load_lists()
 
+    async def test_timeout(self, mocked, session, monkeypatch):
+        """Test the configured timeout is passed on to the request."""
+        url = f"https://api.getbring.com/rest/bringusers/{UUID}/lists"
+        mocked.get(url, status=HTTPStatus.OK, payload=BRING_LOAD_LISTS_RESPONSE)
+        timeout = aiohttp.ClientTimeout(total=5)
+        bring = Bring(session, "EMAIL", "PASSWORD", timeout=timeout)
+        monkeypatch.setattr(bring, "uuid", UUID)
+
+        await bring.load_lists()
+
+        mocked.assert_called_with(
+            url, method="GET", headers=DEFAULT_HEADERS, timeout=timeout
+        )
+
 
 class TestNotifications:
     """Tests for notification method."""
@@ -419,6 +464,7 @@ class TestGetList:
         mocked.get(
             f"https://api.getbring.com/rest/v2/bringlists/{UUID}",
             exception=exception,
+            repeat=True,
         )
 
         with pytest.raises(BringRequestException):
@@ -465,12 +511,108 @@ class TestGetList:
         )
 
         monkeypatch.setattr(Bring, "_Bring__locale", lambda _, x: "de-DE")
-        monkeypatch.setattr(Bring, "_Bring__translate", mocked_translate)
+        monkeypatch.setattr(bring, "_Bring__translations", {"de-DE": {}})
         monkeypatch.setattr(bring, "uuid", UUID)
 
         data = await bring.get_list(UUID)
         assert data == snapshot
 
+    @pytest.mark.parametrize(
+        ("locale", "exception"),
+        [
+            ("en-US", BringTranslationException),
+            ("en-ES", ValueError),
+        ],
+    )
+    async def test_get_list_translation_error(
+        self, mocked, bring, monkeypatch, locale, exception
+    ):
+        """Test a missing or unsupported list locale raises like batch_update_list."""
+        mocked.get(
+            f"https://api.getbring.com/rest/v2/bringlists/{UUID}",
+            status=HTTPStatus.OK,
+            payload=BRING_GET_LIST_RESPONSE,
+        )
+        monkeypatch.setattr(Bring, "_Bring__locale", lambda _, x: locale)
+
+        with pytest.raises(exception):
+            await bring.get_list(UUID)
+
+    async def test_get_list_translated(self, mocked, bring, monkeypatch):
+        """Test items are translated to the list locale."""
+        mocked.get(
+            f"https://api.getbring.com/rest/v2/bringlists/{UUID}",
+            status=HTTPStatus.OK,
+            payload=BRING_GET_LIST_RESPONSE,
+        )
+        monkeypatch.setattr(Bring, "_Bring__locale", lambda _, x: "en-US")
+        monkeypatch.setattr(
+            bring, "_Bring__translations", {"en-US": {"Paprika": "Bell pepper"}}
+        )
+
+        data = await bring.get_list(UUID)
+
+        assert [item.itemId for item in data.items.purchase] == [
+            "Bell pepper",
+            "Zucchetti",
+        ]
+        assert [item.itemId for item in data.items.recently] == [
+            "Bell pepper",
+            "Pouletbrüstli",
+        ]
+
+    async def test_get_list_concurrent(self, mocked, bring, monkeypatch):
+        """Test concurrent calls share one request but get their own response."""
+        mocked.get(
+            f"https://api.getbring.com/rest/v2/bringlists/{UUID}",
+            status=HTTPStatus.OK,
+            payload=BRING_GET_LIST_RESPONSE,
+            repeat=True,
+        )
+        monkeypatch.setattr(Bring, "_Bring__locale", lambda _, x: "en-US")
+        monkeypatch.setattr(
+            bring, "_Bring__translations", {"en-US": {"Paprika": "Bell pepper"}}
+        )
+
+        first, second = await asyncio.gather(bring.get_list(UUID), bring.get_list(UUID))
+
+        assert first == second
+        assert first is not second
+        assert first.items.purchase[0].itemId == "Bell pepper"
+        url = URL(f"https://api.getbring.com/rest/v2/bringlists/{UUID}")
+        assert len(mocked.requests[("GET", url)]) == 1
+
+    async def test_get_list_after_write(self, mocked, bring, monkeypatch):
+        """Test a read issued after a write does not join an older request."""
+        old = orjson.dumps(BRING_GET_LIST_RESPONSE)
+        new = orjson.dumps({**BRING_GET_LIST_RESPONSE, "status": "REGISTERED"})
+        gate = asyncio.Event()
+        fetched = []
+
+        async def fetch(self, url, name):
+            fetched.append(url)
+            if len(fetched) == 1:
+                await gate.wait()
+                return old
+            return new
+
+        monkeypatch.setattr(Bring, "_Bring__fetch", fetch)
+        mocked.post(
+            f"https://api.getbring.com/rest/v2/bringnotifications/lists/{UUID}",
+            status=HTTPStatus.OK,
+        )
+
+        before = asyncio.create_task(bring.get_list(UUID))
+        await asyncio.sleep(0)
+        await bring.notify(UUID, BringNotificationType.GOING_SHOPPING)
+        after = asyncio.create_task(bring.get_list(UUID))
+        await asyncio.sleep(0)
+        gate.set()
+
+        assert (await before).status == "SHARED"
+        assert (await after).status == "REGISTERED"
+        assert len(fetched) == 2
+
 
 class TestGetAllItemDetails:
     """Test for get_all_item_details method."""
@@ -541,6 +683,7 @@ class TestGetAllItemDetails:
         mocked.get(
             f"https://api.getbring.com/rest/bringlists/{UUID}/details",
             exception=exception,
+            repeat=True,
         )
 
         with pytest.raises(BringRequestException):
@@ -752,6 +895,112 @@ class TestCompleteItem:
         )
 
 
+class TestItemBatching:
+    """Test coalescing of item changes with a batch window."""
+
+    async def test_batch_window(self, session, mocked, monkeypatch):
+        """Test item changes within the window are sent in one request."""
+        mocked.put(
+            url := f"https://api.getbring.com/rest/v2/bringlists/{UUID}/items",
+            status=HTTPStatus.OK,
+        )
+        monkeypatch.setattr(Bring, "_Bring__locale", lambda _, x: "de-DE")
+        bring = Bring(session, "EMAIL", "PASSWORD", batch_window=0.01)
+        monkeypatch.setattr(bring, "_Bring__translations", {"de-DE": {}})
+
+        responses = await asyncio.gather(
+            bring.save_item(UUID, "item0", "spec"),
+            bring.remove_item(UUID, "item1"),
+            bring.complete_item(UUID, "item2"),
+        )
+
+        assert all(r is responses[0] for r in responses)
+        assert len(mocked.requests[("PUT", URL(url))]) == 1
+        payload = mocked.requests[("PUT", URL(url))][0].kwargs["data"]
+        changes = orjson.loads(payload.decode())["changes"]
+        assert [(c["itemId"], c["operation"]) for c in changes] == [
+            ("item0", BringItemOperation.ADD),
+            ("item1", BringItemOperation.REMOVE),
+            ("item2", BringItemOperation.COMPLETE),
+        ]
+
+    async def test_flush(self, session, mocked, monkeypatch):
+        """Test flush sends queued changes before the window ends."""
+        mocked.put(
+            f"https://api.getbring.com/rest/v2/bringlists/{UUID}/items",
+            status=HTTPStatus.OK,
+        )
+        monkeypatch.setattr(Bring, "_Bring__locale", lambda _, x: "de-DE")
+        bring = Bring(session, "EMAIL", "PASSWORD", batch_window=3600)
+        monkeypatch.setattr(bring, "_Bring__translations", {"de-DE": {}})
+
+        task = asyncio.create_task(bring.save_item(UUID, "item0"))
+        await asyncio.sleep(0)
+        await bring.flush()
+
+        assert (await task).status == HTTPStatus.OK
+
+    async def test_flush_in_flight(self, session, monkeypatch):
+        """Test flush waits for a batch already being sent after the window."""
+        bring = Bring(session, "EMAIL", "PASSWORD", batch_window=0.01)
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def batch_update_list(list_uuid, items, operation=None):
+            started.set()
+            await release.wait()
+            return mock.sentinel.response
+
+        monkeypatch.setattr(bring, "batch_update_list", batch_update_list)
+
+        task = asyncio.create_task(bring.save_item(UUID, "item0"))
+        await started.wait()
+        flush = asyncio.create_task(bring.flush())
+        await asyncio.sleep(0)
+        assert not flush.done()
+
+        release.set()
+        await flush
+
+        assert task.done()
+        assert task.result() is mock.sentinel.response
+
+    async def test_flush_cancelled(self, session, monkeypatch):
+        """Test callers are not left waiting when a flush is cancelled."""
+        bring = Bring(session, "EMAIL", "PASSWORD", batch_window=3600)
+
+        async def batch_update_list(list_uuid, items, operation=None):
+            await asyncio.Event().wait()
+
+        monkeypatch.setattr(bring, "batch_update_list", batch_update_list)
+
+        task = asyncio.create_task(bring.save_item(UUID, "item0"))
+        await asyncio.sleep(0)
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(bring.flush(), 0.01)
+
+        await asyncio.wait([task], timeout=1)
+        assert task.cancelled()
+        assert bring._pending_changes == {}
+
+    async def test_request_exception(self, session, mocked, monkeypatch):
+        """Test a failed batch request is raised to every caller."""
+        mocked.put(
+            f"https://api.getbring.com/rest/v2/bringlists/{UUID}/items",
+            exception=aiohttp.ClientError,
+        )
+        monkeypatch.setattr(Bring, "_Bring__locale", lambda _, x: "de-DE")
+        bring = Bring(session, "EMAIL", "PASSWORD", batch_window=0.01)
+        monkeypatch.setattr(bring, "_Bring__translations", {"de-DE": {}})
+
+        results = await asyncio.gather(
+            bring.save_item(UUID, "item0"),
+            bring.remove_item(UUID, "item1"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, BringRequestException) for r in results)
+
+
 class TestArticleTranslations:
     """Test loading of article translation tables."""
 
@@ -768,6 +1017,30 @@ class TestArticleTranslations:
         assert dictionary["Pouletbrüstli"] == "Pouletbrüstli"
         assert len(dictionary) == 444
 
+    def test_load_file_cached(self, bring, session):
+        """Test the parsed file is shared between instances."""
+
+        other = Bring(session, "EMAIL", "PASSWORD")
+
+        assert bring._Bring__load_article_translations_from_file(
+            "de-CH"
+        ) is other._Bring__load_article_translations_from_file("de-CH")
+
+    async def test_load_file_cached_inline(self, bring, monkeypatch):
+        """Test a cached file is not read in a worker thread again."""
+
+        bring._Bring__load_article_translations_from_file("de-DE")
+
+        async def mocked_to_thread(*args, **kwargs):
+            raise AssertionError("Cached file read in worker thread")
+
+        monkeypatch.setattr(asyncio, "to_thread", mocked_to_thread)
+        monkeypatch.setattr(bring, "user_locale", "de-DE")
+
+        dictionaries = await bring._Bring__load_article_translations()
+
+        assert len(dictionaries["de-DE"]) == 444
+
     async def test_load_from_list_article_language(self, bring, monkeypatch):
         """Test loading json from listArticleLanguage."""
 
@@ -875,6 +1148,33 @@ class TestArticleTranslations:
 
         assert dictionaries["de-DE"] == {"test": "test"}
 
+    async def test_load_fallback_to_download_multiple(self, bring, mocked, monkeypatch):
+        """Test downloading the translations for several locales."""
+        for locale in ("de-DE", "en-US"):
+            mocked.get(
+                f"https://web.getbring.com/locale/articles.{locale}.json",
+                payload={"test": locale},
+                status=HTTPStatus.OK,
+            )
+
+        monkeypatch.setattr(bring, "user_locale", "de-DE")
+        monkeypatch.setattr(
+            bring, "user_list_settings", {UUID: {"listArticleLanguage": "en-US"}}
+        )
+
+        monkeypatch.setattr(
+            Bring,
+            "_Bring__load_article_translations_from_file",
+            self.mocked__load_article_translations_from_file,
+        )
+
+        dictionaries = await bring._Bring__load_article_translations()
+
+        assert dictionaries == {
+            "de-DE": {"test": "de-DE"},
+            "en-US": {"test": "en-US"},
+        }
+
     @pytest.mark.parametrize(
         "exception",
         [
@@ -885,7 +1185,9 @@ class TestArticleTranslations:
     async def test_request_exceptions(self, bring, mocked, monkeypatch, exception):
         """Test loading json and fallback to download from web."""
         mocked.get(
-            "https://web.getbring.com/locale/articles.de-DE.json", exception=exception
+            "https://web.getbring.com/locale/articles.de-DE.json",
+            exception=exception,
+            repeat=True,
         )
 
         monkeypatch.setattr(bring, "user_locale", "de-DE")
@@ -950,6 +1252,7 @@ class TestGetUserAccount:
         mocked.get(
             f"https://api.getbring.com/rest/v2/bringusers/{UUID}",
             exception=exception,
+            repeat=True,
         )
         monkeypatch.setattr(bring, "uuid", UUID)
 
@@ -1020,6 +1323,7 @@ class TestGetAllUserSettings:
         mocked.get(
             f"https://api.getbring.com/rest/bringusersettings/{UUID}",
             exception=exception,
+            repeat=True,
         )
         monkeypatch.setattr(bring, "uuid", UUID)
 
@@ -1084,49 +1388,66 @@ class TestGetAllUserSettings:
             await bring._Bring__load_user_list_settings()
 
 
-class TestTranslate:
-    """Test for __translate method."""
+class TestTranslationTable:
+    """Test for __translation_table method."""
 
-    def test_translate_to_locale(self, bring, monkeypatch):
-        """Test __translate with to_locale."""
+    def test_translation_table(self, bring, monkeypatch):
+        """Test the dictionary translating to the locale."""
         monkeypatch.setattr(
             bring, "_Bring__translations", {"de-DE": {"Pouletbrüstli": "Hähnchenbrust"}}
         )
 
-        item = bring._Bring__translate("Pouletbrüstli", to_locale="de-DE")
+        table = bring._Bring__translation_table("de-DE")
 
-        assert item == "Hähnchenbrust"
+        assert table == {"Pouletbrüstli": "Hähnchenbrust"}
 
-    def test_translate_from_locale(self, bring, monkeypatch):
-        """Test __translate with from_locale."""
+    def test_translation_table_inverse(self, bring, monkeypatch):
+        """Test the dictionary translating from the locale."""
         monkeypatch.setattr(
             bring, "_Bring__translations", {"de-DE": {"Pouletbrüstli": "Hähnchenbrust"}}
         )
 
-        item = bring._Bring__translate("Hähnchenbrust", from_locale="de-DE")
+        table = bring._Bring__translation_table("de-DE", inverse=True)
 
-        assert item == "Pouletbrüstli"
+        assert table == {"Hähnchenbrust": "Pouletbrüstli"}
 
-    def test_translate_value_error_no_locale(self, bring):
-        """Test __translate with missing locale argument."""
-        with pytest.raises(
-            ValueError,
-            match="One of the arguments from_locale or to_locale required.",
-        ):
-            bring._Bring__translate("item_name")
+    async def test_translation_table_inverse_cached(self, bring, monkeypatch):
+        """Test the inverse dictionary is cached until translations reload."""
+        monkeypatch.setattr(
+            bring, "_Bring__translations", {"de-DE": {"Pouletbrüstli": "Hähnchenbrust"}}
+        )
+
+        table = bring._Bring__translation_table("de-DE", inverse=True)
+
+        assert bring._Bring__translation_table("de-DE", inverse=True) is table
 
-    def test_translate_value_error_unsupported_locale(self, bring):
-        """Test __translate with unsupported locale."""
+        async def mocked_load_article_translations(self):
+            return {"de-DE": {"Pouletbrüstli": "Hühnerbrust"}}
+
+        monkeypatch.setattr(
+            Bring,
+            "_Bring__load_article_translations",
+            mocked_load_article_translations,
+        )
+        await bring.reload_article_translations()
+
+        assert bring._Bring__inverse_translations == {}
+        assert bring._Bring__translation_table("de-DE", inverse=True) == {
+            "Hühnerbrust": "Pouletbrüstli"
+        }
+
+    def test_translation_table_unsupported_locale(self, bring):
+        """Test __translation_table with unsupported locale."""
         locale = "en-ES"
         with pytest.raises(
             ValueError, match=f"Locale {locale} not supported by Bring."
         ):
-            bring._Bring__translate("item_name", from_locale=locale)
+            bring._Bring__translation_table(locale)
 
-    def test_translate_exception(self, bring):
-        """Test __translate BringTranslationException."""
+    def test_translation_table_exception(self, bring):
+        """Test __translation_table BringTranslationException."""
         with pytest.raises(BringTranslationException):
-            bring._Bring__translate("item_name", from_locale="de-DE")
+            bring._Bring__translation_table("de-DE", inverse=True)
 
 
 class TestBatchUpdateList:
@@ -1272,7 +1593,7 @@ class TestBatchUpdateList:
             status=HTTPStatus.OK,
         )
         monkeypatch.setattr(Bring, "_Bring__locale", lambda _, x: "de-DE")
-        monkeypatch.setattr(Bring, "_Bring__translate", mocked_translate)
+        monkeypatch.setattr(bring, "_Bring__translations", {"de-DE": {}})
 
         if operation:
             r = await bring.batch_update_list(UUID, item, operation)
@@ -1282,10 +1603,57 @@ class TestBatchUpdateList:
         mocked.assert_called_with(
             url,
             method="PUT",
+            args_to_match=("headers", "timeout"),
             headers=DEFAULT_HEADERS,
-            data=None,
-            json=expected,
+            timeout=REQUEST_TIMEOUT,
         )
+        payload = mocked.requests[("PUT", URL(url))][-1].kwargs["data"]
+        assert payload.content_type == "application/json"
+        assert orjson.loads(payload.decode()) == expected
+
+    async def test_batch_update_list_translated(self, bring, mocked, monkeypatch):
+        """Test item names are translated back to catalog names."""
+        mocked.put(
+            url := f"https://api.getbring.com/rest/v2/bringlists/{UUID}/items",
+            status=HTTPStatus.OK,
+        )
+        monkeypatch.setattr(Bring, "_Bring__locale", lambda _, x: "de-DE")
+        monkeypatch.setattr(
+            bring, "_Bring__translations", {"de-DE": {"Pouletbrüstli": "Hähnchenbrust"}}
+        )
+
+        await bring.batch_update_list(
+            UUID,
+            [
+                BringItem(itemId="Hähnchenbrust", spec="", uuid=""),
+                BringItem(itemId="Eigener Artikel", spec="", uuid=""),
+            ],
+        )
+
+        payload = mocked.requests[("PUT", URL(url))][-1].kwargs["data"]
+        changes = orjson.loads(payload.decode())["changes"]
+        assert [change["itemId"] for change in changes] == [
+            "Pouletbrüstli",
+            "Eigener Artikel",
+        ]
+
+    @pytest.mark.parametrize(
+        ("locale", "exception"),
+        [
+            ("en-US", BringTranslationException),
+            ("en-ES", ValueError),
+        ],
+    )
+    async def test_batch_update_list_translation_error(
+        self, bring, monkeypatch, locale, exception
+    ):
+        """Test a missing or unsupported list locale raises before sending."""
+        monkeypatch.setattr(Bring, "_Bring__locale", lambda _, x: locale)
+
+        with pytest.raises(exception):
+            await bring.batch_update_list(
+                UUID, BringItem(itemId="Hähnchenbrust", spec="", uuid="")
+            )
 
     async def test_batch_update_list_multiple_items(self, bring, mocked, monkeypatch):
         """Test batch_update_list."""
@@ -1350,7 +1718,7 @@ class TestBatchUpdateList:
             status=HTTPStatus.OK,
         )
         monkeypatch.setattr(Bring, "_Bring__locale", lambda _, x: "de-DE")
-        monkeypatch.setattr(Bring, "_Bring__translate", mocked_translate)
+        monkeypatch.setattr(bring, "_Bring__translations", {"de-DE": {}})
 
         r = await bring.batch_update_list(UUID, test_items)
 
@@ -1358,10 +1726,13 @@ class TestBatchUpdateList:
         mocked.assert_called_with(
             url,
             method="PUT",
+            args_to_match=("headers", "timeout"),
             headers=DEFAULT_HEADERS,
-            data=None,
-            json=expected,
+            timeout=REQUEST_TIMEOUT,
         )
+        payload = mocked.requests[("PUT", URL(url))][-1].kwargs["data"]
+        assert payload.content_type == "application/json"
+        assert orjson.loads(payload.decode()) == expected
 
     @pytest.mark.parametrize(
         "exception",
@@ -1431,6 +1802,64 @@ class TestRetrieveNewAccessToken:
         assert bring.headers["Authorization"] == "Bearer {access_token}"
         assert bring.expires_in == BRING_TOKEN_RESPONSE["expires_in"]
 
+    def test_expires_in_wall_clock(self, bring, monkeypatch):
+        """Test the token expiration follows the wall clock."""
+        monkeypatch.setattr(time, "time", lambda: 0)
+        bring.expires_in = 100
+
+        monkeypatch.setattr(time, "time", lambda: 40)
+        assert bring.expires_in == 60
+
+        monkeypatch.setattr(time, "time", lambda: 200)
+        assert bring.expires_in == 0
+
+    async def test_retrieve_new_access_token_concurrent(self, mocked, bring):
+        """Test concurrent calls share one token request."""
+        mocked.post(
+            "https://api.getbring.com/rest/v2/bringauth/token",
+            status=HTTPStatus.OK,
+            payload=BRING_TOKEN_RESPONSE,
+            repeat=True,
+        )
+
+        first, second = await asyncio.gather(
+            bring.retrieve_new_access_token("test_refresh_token"),
+            bring.retrieve_new_access_token("test_refresh_token"),
+        )
+
+        assert first is second
+        assert len(mocked.requests[("POST", URL(bring._url_token))]) == 1
+
+    async def test_retrieve_new_access_token_cancelled(self, bring, monkeypatch):
+        """Test a failed shared refresh is not reported once all callers left."""
+        release = asyncio.Event()
+
+        async def refresh_token(self, refresh_token):
+            await release.wait()
+            raise BringRequestException
+
+        monkeypatch.setattr(Bring, "_Bring__retrieve_new_access_token", refresh_token)
+        loop = asyncio.get_running_loop()
+        errors = []
+        monkeypatch.setattr(loop, "call_exception_handler", errors.append)
+
+        waiter = asyncio.create_task(
+            bring.retrieve_new_access_token("test_refresh_token")
+        )
+        await asyncio.sleep(0)
+        refresh = bring._token_refresh[1]
+        waiter.cancel()
+        await asyncio.wait([waiter])
+        release.set()
+        await asyncio.wait([refresh])
+
+        assert not refresh.cancelled()
+        del waiter, refresh
+        bring._token_refresh = None
+        gc.collect()
+
+        assert errors == []
+
     @pytest.mark.parametrize(
         "exception",
         [
@@ -1505,6 +1934,85 @@ class TestSetListArticleLanguage:
         resp = await bring.set_list_article_language(UUID, "de-DE")
         assert resp.status == HTTPStatus.OK
 
+    async def test_set_list_article_language_loaded(self, mocked, bring, monkeypatch):
+        """Test translations are not reloaded when the language is loaded."""
+        mocked.post(
+            f"https://api.getbring.com/rest/bringusersettings/{UUID}/{UUID}/listArticleLanguage",
+            status=HTTPStatus.OK,
+        )
+
+        monkeypatch.setattr(bring, "uuid", UUID)
+        monkeypatch.setattr(bring, "_Bring__translations", {"de-DE": {}})
+
+        async def mocked__load_user_list_settings(*args, **kwargs):
+            """Mock __load_user_list_settings."""
+            return {UUID: {"listArticleLanguage": "de-DE"}}
+
+        async def mocked__load_article_translations(*args, **kwargs):
+            """Mock __load_article_translations."""
+            raise AssertionError("Translations reloaded")
+
+        monkeypatch.setattr(
+            Bring, "_Bring__load_user_list_settings", mocked__load_user_list_settings
+        )
+        monkeypatch.setattr(
+            Bring,
+            "_Bring__load_article_translations",
+            mocked__load_article_translations,
+        )
+
+        resp = await bring.set_list_article_language(UUID, "de-DE")
+        assert resp.status == HTTPStatus.OK
+
+    async def test_set_list_article_language_concurrent(
+        self, mocked, bring, monkeypatch
+    ):
+        """Test concurrent changes coalesce their settings reloads."""
+        mocked.post(
+            f"https://api.getbring.com/rest/bringusersettings/{UUID}/{UUID}/listArticleLanguage",
+            status=HTTPStatus.OK,
+            repeat=True,
+        )
+
+        monkeypatch.setattr(bring, "uuid", UUID)
+        calls = 0
+
+        async def mocked__load_user_list_settings(*args, **kwargs):
+            """Mock __load_user_list_settings."""
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {}
+
+        monkeypatch.setattr(
+            Bring, "_Bring__load_user_list_settings", mocked__load_user_list_settings
+        )
+
+        await asyncio.gather(
+            *(bring.set_list_article_language(UUID, "de-DE") for _ in range(3))
+        )
+
+        assert calls == 2
+
+    @pytest.mark.parametrize(
+        "method", ["reload_user_list_settings", "reload_article_translations"]
+    )
+    async def test_reload_waits_for_settings_lock(self, bring, monkeypatch, method):
+        """Test the public reloads do not run during a settings reload."""
+
+        async def mocked_load(*args, **kwargs):
+            """Mock the settings and translations loaders."""
+            return {}
+
+        monkeypatch.setattr(Bring, "_Bring__load_user_list_settings", mocked_load)
+        monkeypatch.setattr(Bring, "_Bring__load_article_translations", mocked_load)
+
+        async with bring._settings_lock:
+            task = asyncio.create_task(getattr(bring, method)())
+            await asyncio.sleep(0)
+            assert not task.done()
+        await task
+
     @pytest.mark.parametrize(
         "exception",
         [
@@ -1578,6 +2086,7 @@ class TestGetActivity:
         mocked.get(
             f"https://api.getbring.com/rest/v2/bringlists/{UUID}/activity",
             exception=exception,
+            repeat=True,
         )
 
         with pytest.raises(BringRequestException):
@@ -1614,3 +2123,123 @@ class TestGetActivity:
 
         with pytest.raises(exception):
             await bring.get_activity(uuid.UUID(UUID))
+
+
+class TestInit:
+    """Tests for the Bring constructor."""
+
+    def test_init_without_event_loop(self):
+        """Test Bring can be created outside of a running event loop."""
+        bring = Bring(mock.Mock(spec=aiohttp.ClientSession), "EMAIL", "PASSWORD")
+        assert bring.mail == "EMAIL"
+
+
+class TestCreateSession:
+    """Tests for create_session method."""
+
+    async def test_create_session(self):
+        """Test the session is created with a tuned connector."""
+        async with Bring.create_session() as session:
+            assert session.connector.limit == 20
+            assert session.connector.limit_per_host == 10
+            assert session.connector._keepalive_timeout == 75
+            assert session.timeout == REQUEST_TIMEOUT
+
+
+class TestRequestRetry:
+    """Tests for retrying transient request failures."""
+
+    @pytest.mark.parametrize(
+        "failure",
+        [
+            {"status": HTTPStatus.BAD_GATEWAY},
+            {"status": HTTPStatus.SERVICE_UNAVAILABLE},
+            {"status": HTTPStatus.GATEWAY_TIMEOUT},
+            {"exception": asyncio.TimeoutError},
+            {"exception": aiohttp.ServerDisconnectedError()},
+        ],
+    )
+    async def test_retry_succeeds(self, mocked, bring, monkeypatch, failure):
+        """Test transient failures are retried."""
+        url = f"https://api.getbring.com/rest/bringusers/{UUID}/lists"
+        mocked.get(url, **failure)
+        mocked.get(url, **failure)
+        mocked.get(url, status=HTTPStatus.OK, payload=BRING_LOAD_LISTS_RESPONSE)
+        monkeypatch.setattr(bring, "uuid", UUID)
+
+        lists = await bring.load_lists()
+
+        assert lists.lists[0].name == "Einkauf"
+
+    async def test_retry_exhausted(self, mocked, bring, monkeypatch):
+        """Test the last failure is raised after all attempts."""
+        url = f"https://api.getbring.com/rest/bringusers/{UUID}/lists"
+        for _ in range(3):
+            mocked.get(url, status=HTTPStatus.SERVICE_UNAVAILABLE)
+        mocked.get(url, status=HTTPStatus.OK, payload=BRING_LOAD_LISTS_RESPONSE)
+        monkeypatch.setattr(bring, "uuid", UUID)
+
+        with pytest.raises(BringRequestException):
+            await bring.load_lists()
+
+    async def test_retry_max_delay(self, mocked, bring, monkeypatch):
+        """Test the jittered backoff never exceeds the maximum delay."""
+        url = f"https://api.getbring.com/rest/bringusers/{UUID}/lists"
+        mocked.get(url, status=HTTPStatus.SERVICE_UNAVAILABLE)
+        mocked.get(url, status=HTTPStatus.OK, payload=BRING_LOAD_LISTS_RESPONSE)
+        monkeypatch.setattr(bring, "uuid", UUID)
+        monkeypatch.setattr("bring_api.bring.REQUEST_RETRY_BACKOFF", 1000)
+        monkeypatch.setattr("bring_api.bring.random.uniform", lambda a, b: b)
+        delays = []
+
+        async def sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr("bring_api.bring.asyncio.sleep", sleep)
+
+        await bring.load_lists()
+
+        assert delays == [REQUEST_RETRY_MAX_DELAY]
+
+    async def test_no_retry_non_idempotent(self, mocked, bring):
+        """Test non-idempotent requests are not retried."""
+        url = f"https://api.getbring.com/rest/v2/bringnotifications/lists/{UUID}"
+        mocked.post(url, status=HTTPStatus.SERVICE_UNAVAILABLE)
+        mocked.post(url, status=HTTPStatus.OK)
+
+        with pytest.raises(BringRequestException):
+            await bring.notify(UUID, BringNotificationType.GOING_SHOPPING)
+
+
+class TestPackageExports:
+    """Tests for the lazy package exports."""
+
+    def test_exports_resolve(self):
+        """Test all lazy names resolve to the submodule objects."""
+
+        for name, mod_name in bring_api._LAZY.items():
+            assert getattr(bring_api, name) is getattr(
+                importlib.import_module(mod_name, "bring_api"), name
+            )
+
+    @pytest.mark.parametrize("mod_name", [".bring", ".types"])
+    def test_lazy_table_matches_submodules(self, mod_name):
+        """Test the lazy import table matches the __all__ of each submodule."""
+
+        module = importlib.import_module(mod_name, "bring_api")
+        assert {
+            name for name, owner in bring_api._LAZY.items() if owner == mod_name
+        } == set(module.__all__)
+
+    def test_all_matches_submodules(self):
+        """Test __all__ lists the lazy names and the exceptions."""
+
+        assert sorted(bring_api.__all__) == sorted(
+            [*bring_api._LAZY, *bring_api.exceptions.__all__]
+        )
+
+    def test_unknown_attribute(self):
+        """Test access to an unknown name raises AttributeError."""
+
+        with pytest.raises(AttributeError):
+            bring_api.DoesNotExist  # noqa: B018